@@ -1,40 +1,100 @@
 """Image processing and conversion utilities for the Sticker Factory."""
 
 import logging
+from functools import lru_cache
 from PIL import Image, ImageOps
 
 logger = logging.getLogger("sticker_factory.image_utils")
 
+# numpy is optional - zero-copy tile slicing when installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def preper_image(image, label_width):
-    """Prepare image by resizing and dithering for thermal printer output."""
-    if image.mode == "RGBA":
+# cykooz.resizer is optional - SIMD (AVX2/NEON) Lanczos when installed, Pillow otherwise
+try:
+    from cykooz.resizer import Resizer, ResizeAlg, FilterType
+    _RESIZER = Resizer(ResizeAlg.convolution(FilterType.lanczos3))
+except ImportError:
+    _RESIZER = None
+
+
+def _resize_lanczos(image, size):
+    """Lanczos resize, taking the SIMD fast path when cykooz.resizer is available."""
+    if _RESIZER is not None:
+        dst = Image.new(image.mode, size)
+        _RESIZER.resize_pil(image, dst)
+        return dst
+    return image.resize(size, Image.LANCZOS)
+
+
+def _flatten_alpha(image):
+    """Flatten RGBA onto a white background, returning RGB.
+
+    Skips the full-image blend when the alpha channel is fully opaque,
+    which is the common case for PNGs that merely got saved as RGBA.
+    """
+    alpha_min = image.getextrema()[-1][0]
+    if alpha_min < 255:
         background = Image.new("RGBA", image.size, "white")
         image = Image.alpha_composite(background, image)
-        image = image.convert("RGB")
+    return image.convert("RGB")
 
-    width, height = image.size
-    if width != label_width:
-        new_height = int((label_width / width) * height)
-        image = image.resize((label_width, new_height))
-        logger.debug(f"Resizing image from ({width}, {height}) >> {image.size}")
 
+def _dither(grayscale_image, dither_scale):
+    # Floyd-Steinberg runs inside Pillow's C core here; no Python-level pixel loop
+    if dither_scale > 1:
+        reduced = grayscale_image.reduce(dither_scale)
+        dithered = reduced.convert("1", dither=Image.FLOYDSTEINBERG)
+        return dithered.resize(grayscale_image.size, Image.NEAREST)
+    return grayscale_image.convert("1", dither=Image.FLOYDSTEINBERG)
+
+
+def preper_image(image, label_width, dither_scale=1):
+    """Prepare image by resizing and dithering for thermal printer output.
+
+    dither_scale > 1 runs the dither on a reduced buffer and scales the
+    result back up with nearest - an opt-in fast path for previews where
+    a coarser dither pattern is acceptable.
+    """
+    # Fast path: already grayscale at label width (webcam frames, prepared
+    # PNGs) - nothing to flatten, convert or resize, go straight to dither
+    if image.mode == "L" and image.width == label_width:
+        return image, _dither(image, dither_scale)
+
+    if image.mode == "RGBA":
+        image = _flatten_alpha(image)
+
+    # Grayscale before resizing: the resize then moves one channel instead
+    # of three, and the dither consumes its output directly.
     if image.mode != "L":
         grayscale_image = image.convert("L")
     else:
         grayscale_image = image
 
-    dithered_image = grayscale_image.convert("1", dither=Image.FLOYDSTEINBERG)
+    width, height = grayscale_image.size
+    if width != label_width:
+        new_height = int((label_width / width) * height)
+        grayscale_image = _resize_lanczos(grayscale_image, (label_width, new_height))
+        logger.debug(f"Resizing image from ({width}, {height}) >> {grayscale_image.size}")
+
+    dithered_image = _dither(grayscale_image, dither_scale)
 
     return grayscale_image, dithered_image
 
 
+@lru_cache(maxsize=256)
+def _threshold_lut(threshold):
+    """Build a 256-byte lookup table mapping values above threshold to white."""
+    return bytes(255 if i > threshold else 0 for i in range(256))
+
+
 def apply_threshold(image, threshold):
     """Apply threshold to convert image to black and white."""
     if image.mode != 'L':
         image = image.convert('L')
-    lut = [255 if i > threshold else 0 for i in range(256)]
-    return image.point(lut, mode='1')
+    return image.point(_threshold_lut(threshold), mode='1')
 
 
 def resize_image_to_width(image, target_width_mm, label_width, current_dpi=300):
@@ -42,55 +102,83 @@ def resize_image_to_width(image, target_width_mm, label_width, current_dpi=300):
     target_width_inch = target_width_mm / 25.4
     target_width_px = int(target_width_inch * current_dpi)
     current_width = image.width
+    current_height = image.height
     scale_factor = target_width_px / current_width
-    new_height = int(image.height * scale_factor)
-    resized_image = image.resize((target_width_px, new_height), Image.LANCZOS)
+    new_height = int(current_height * scale_factor)
+
+    # On big downscales, box-average with Image.reduce first so the Lanczos
+    # convolution sees far fewer source pixels (the reducing_gap trick)
+    reduce_factor = current_width // target_width_px // 2
+    if reduce_factor > 1 and image.mode != "1":
+        image = image.reduce(reduce_factor)
+
+    resized_image = _resize_lanczos(image, (target_width_px, new_height))
 
     if target_width_px < label_width:
         new_image = Image.new("RGB", (label_width, new_height), (255, 255, 255))
         new_image.paste(resized_image, ((label_width - target_width_px) // 2, 0))
         resized_image = new_image
 
-    logger.debug(f"Image resized from {image.width}x{image.height} to {resized_image.width}x{resized_image.height} pixels.")
+    logger.debug(f"Image resized from {current_width}x{current_height} to {resized_image.width}x{resized_image.height} pixels.")
     logger.debug(f"Target width was {target_width_mm}mm ({target_width_px}px)")
     return resized_image
 
 
 def add_border(image, border_width=1):
     """Add a thin black border around the image."""
-    if image.mode == '1':
-        bordered = Image.new('1', (image.width + 2*border_width, image.height + 2*border_width), 0)
-        bordered.paste(image, (border_width, border_width))
-        return bordered
-    else:
-        return ImageOps.expand(image, border=border_width, fill='black')
+    fill = 0 if image.mode == '1' else 'black'
+    return ImageOps.expand(image, border=border_width, fill=fill)
+
+
+@lru_cache(maxsize=256)
+def _levels_lut(black_point, white_point):
+    """Build a 256-byte lookup table for a levels adjustment."""
+    scale = 255 / max(white_point - black_point, 1)
+    return bytes(
+        min(max(int((i - black_point) * scale), 0), 255) for i in range(256)
+    )
 
 
 def apply_levels(image, black_point=0, white_point=255):
     """Apply levels adjustment to an image."""
     if image.mode != 'L':
         image = image.convert('L')
-    
-    lut = []
-    for i in range(256):
-        if i <= black_point:
-            lut.append(0)
-        elif i >= white_point:
-            lut.append(255)
-        else:
-            normalized = (i - black_point) / (white_point - black_point)
-            lut.append(int(normalized * 255))
-    
-    return image.point(lut)
+
+    return image.point(_levels_lut(black_point, white_point))
 
 
 def apply_histogram_equalization(image, black_point=0, white_point=255):
     """Apply histogram equalization with levels adjustment to an image."""
     if image.mode != 'L':
         image = image.convert('L')
-    
-    leveled = apply_levels(image, black_point, white_point)
-    return ImageOps.equalize(leveled)
+
+    # Fuse the levels and equalization LUTs into one table so the pixel
+    # buffer is traversed once instead of twice: remap the histogram through
+    # the levels LUT, build the equalization LUT from that (same algorithm
+    # as ImageOps.equalize), then compose the two tables.
+    levels_lut = _levels_lut(black_point, white_point)
+
+    histogram = image.histogram()
+    leveled_hist = [0] * 256
+    for value, count in enumerate(histogram):
+        leveled_hist[levels_lut[value]] += count
+
+    nonzero = [count for count in leveled_hist if count]
+    if len(nonzero) <= 1:
+        return image.point(levels_lut)
+
+    step = (sum(nonzero) - nonzero[-1]) // 255
+    if not step:
+        return image.point(levels_lut)
+
+    eq_lut = []
+    n = step // 2
+    for count in leveled_hist:
+        eq_lut.append(min(n // step, 255))
+        n += count
+
+    fused_lut = bytes(eq_lut[levels_lut[i]] for i in range(256))
+    return image.point(fused_lut)
 
 
 def img_concat_v(im1, im2, image_width):
@@ -126,15 +214,13 @@ def split_image_into_tiles(image, label_width, num_rows):
     """
     # Convert RGBA to RGB if needed
     if image.mode == "RGBA":
-        background = Image.new("RGBA", image.size, "white")
-        image = Image.alpha_composite(background, image)
-        image = image.convert("RGB")
+        image = _flatten_alpha(image)
     
     # Resize image to label width, maintaining aspect ratio
     width, height = image.size
     if width != label_width:
         new_height = int((label_width / width) * height)
-        image = image.resize((label_width, new_height), Image.LANCZOS)
+        image = _resize_lanczos(image, (label_width, new_height))
         logger.debug(f"Resized image to {label_width}x{new_height} for tiling")
     
     width, height = image.size
@@ -145,18 +231,26 @@ def split_image_into_tiles(image, label_width, num_rows):
     
     tiles = []
     y_offset = 0
-    
+
+    # With numpy the tiles are row-slice views into the resized image's
+    # buffer instead of per-tile crop copies; downstream consumers only
+    # read the tiles, so sharing the buffer is safe
+    arr = np.asarray(image) if np is not None else None
+
     for i in range(num_rows):
         # Add remainder to the last tile
         current_tile_height = tile_height + (remainder if i == num_rows - 1 else 0)
-        
+
         # Extract tile
-        tile = image.crop((0, y_offset, width, y_offset + current_tile_height))
+        if arr is not None:
+            tile = Image.fromarray(arr[y_offset:y_offset + current_tile_height])
+        else:
+            tile = image.crop((0, y_offset, width, y_offset + current_tile_height))
         tiles.append(tile)
-        
+
         y_offset += current_tile_height
         logger.debug(f"Created tile {i+1}/{num_rows}: {tile.size}")
-    
+
     return tiles
 
 
@@ -172,29 +266,30 @@ def create_tile_preview(tiles, label_width):
         PIL Image showing all tiles in a grid layout
     """
     num_tiles = len(tiles)
-    
+
     # Calculate preview dimensions
     # Scale down tiles for preview (max 300px wide per tile)
     preview_scale = min(1.0, 300 / label_width)
     preview_tile_width = int(label_width * preview_scale)
-    
-    # Find max tile height for preview
-    max_tile_height = max(tile.height for tile in tiles)
-    preview_tile_height = int(max_tile_height * preview_scale)
-    
-    # Create preview image
-    # Arrange tiles in a single column for preview
+
+    # Resize all tiles up front and size the canvas from the results - one
+    # pass over the tiles instead of a separate max-height scan, and the
+    # canvas fits the actual heights with no trailing whitespace
+    tile_previews = [
+        _resize_lanczos(tile, (preview_tile_width, int(tile.height * preview_scale)))
+        for tile in tiles
+    ]
+
+    # Arrange tiles in a single column for preview, 10px spacing between tiles
     preview_width = preview_tile_width
-    preview_height = preview_tile_height * num_tiles + (10 * (num_tiles - 1))  # 10px spacing between tiles
-    
+    preview_height = sum(tp.height for tp in tile_previews) + 10 * (num_tiles - 1)
+
     preview = Image.new("RGB", (preview_width, preview_height), "white")
-    
+
     y_offset = 0
-    for i, tile in enumerate(tiles):
-        # Resize tile for preview
-        tile_preview = tile.resize((preview_tile_width, int(tile.height * preview_scale)), Image.LANCZOS)
+    for tile_preview in tile_previews:
         preview.paste(tile_preview, (0, y_offset))
         y_offset += tile_preview.height + 10  # Add spacing
-    
+
     logger.debug(f"Created preview image: {preview.size}")
     return preview
@@ -206,8 +206,8 @@ def get_label_width(label_type):
             return width
     raise ValueError(f"Label type {label_type} not found in label definitions")
 
-def print_image(image, printer_info, rotate=0, dither=False):
-    """Queue a print job."""
+def queue_print_job(image, printer_info, rotate=0, dither=False):
+    """Add a print job to the queue without waiting for it; returns the job id."""
     temp_dir = tempfile.gettempdir()
     os.makedirs(temp_dir, exist_ok=True)
 
@@ -218,7 +218,7 @@ def print_image(image, printer_info, rotate=0, dither=False):
 
     logger.debug(f"Using label type: {printer_info['label_type']}")
 
-    job_id = print_queue.add_job(
+    return print_queue.add_job(
         image,
         rotate=rotate,
         dither=dither,
@@ -227,6 +227,73 @@ def print_image(image, printer_info, rotate=0, dither=False):
         label_type=printer_info["label_type"]
     )
 
+
+def _save_completed_print(image):
+    """Save a printed sticker to labels/ so it shows up in the History tab.
+
+    Honors PRIVACY_MODE; returns the user-facing message either way.
+    """
+    if PRIVACY_MODE:
+        return "Privacy mode is enabled; sticker not saved locally."
+    filename = safe_filename("Stikka-")
+    image.save(os.path.join("labels", filename), "PNG")
+    return f"Sticker saved as {filename}"
+
+
+def print_images(images, printer_info, rotate=0, dither=False):
+    """Queue several images at once and wait for all of them to finish.
+
+    The queue worker drives a single printer, so jobs still print one after
+    the other - but enqueueing everything up front overlaps the PNG encoding
+    of later images with the printing of earlier ones instead of blocking
+    per image. Returns the number of successfully printed images.
+    """
+    job_ids = [
+        queue_print_job(image, printer_info, rotate=rotate, dither=dither)
+        for image in images
+    ]
+    images_by_job = dict(zip(job_ids, images))
+
+    status_container = st.empty()
+    pending = set(job_ids)
+    success_count = 0
+    failures = []
+
+    while pending:
+        for job_id in list(pending):
+            status = print_queue.get_job_status(job_id)
+            if status.status in ("pending", "processing"):
+                continue
+            pending.discard(job_id)
+            if status.status == "completed":
+                success_count += 1
+                # Same save-to-labels / privacy handling as print_image,
+                # so batch-printed tiles show up in the History tab
+                logger.info(_save_completed_print(images_by_job[job_id]))
+            else:
+                failures.append(f"Print job failed: {status.error}")
+        if pending:
+            status_container.info(f"Printing... {len(job_ids) - len(pending)}/{len(job_ids)} done")
+            time.sleep(0.5)
+
+    status_container.empty()
+    if success_count:
+        if PRIVACY_MODE:
+            st.info("Privacy mode is enabled; stickers not saved locally.")
+        else:
+            st.success(f"Saved {success_count} sticker(s) to labels/")
+    # Failures get their own persistent widgets - written into the progress
+    # st.empty() they would be overwritten by the next poll update
+    for failure in failures:
+        st.warning(failure)
+
+    return success_count
+
+
+def print_image(image, printer_info, rotate=0, dither=False):
+    """Queue a print job."""
+    job_id = queue_print_job(image, printer_info, rotate=rotate, dither=dither)
+
     status = print_queue.get_job_status(job_id)
     status_container = st.empty()
     
@@ -237,13 +304,11 @@ def print_image(image, printer_info, rotate=0, dither=False):
 
     if status.status == "completed":
         status_container.success("Print job completed successfully!")
+        message = _save_completed_print(image)
         if PRIVACY_MODE:
-            status_container.info("Privacy mode is enabled; sticker not saved locally.")
+            status_container.info(message)
         else:
-            filename = safe_filename("Stikka-")
-            file_path = os.path.join("labels", filename)
-            image.save(file_path, "PNG")
-            status_container.success(f"Sticker saved as {filename}")
+            status_container.success(message)
         
         # Record statistics - DISABLED on Raspberry Pi due to SIGILL compatibility issues
         # Uncomment below if stats module works on your system
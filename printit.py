@@ -1,7 +1,7 @@
 import streamlit as st
-import glob
 import os
 import re
+import threading
 import time
 import hashlib
 import logging
@@ -20,7 +20,18 @@ from config_manager import (
     TABS_CONFIG,
 )
 
-# Tabs get imported only when enabled in config.toml
+# Tabs get imported only when enabled in config.toml; modules are imported
+# on a tab's first render and reused from this cache on later reruns
+_tab_module_cache = {}
+
+
+def _get_tab_module(module_name):
+    module = _tab_module_cache.get(module_name)
+    if module is None:
+        import importlib
+        module = importlib.import_module(module_name)
+        _tab_module_cache[module_name] = module
+    return module
 
 
 # Import image utilities
@@ -38,6 +49,7 @@ from image_utils import (
 from printer_utils import (
     find_and_parse_printer,
     print_image,
+    print_images,
     # get_label_type
 )
 
@@ -66,91 +78,156 @@ def get_enabled_tabs():
     return enabled
 
 
-def list_saved_images(filter_duplicates=True):
-    temp_files = glob.glob(os.path.join("temp", "*.[pj][np][g]*"))
-    label_files = glob.glob(os.path.join("labels", "*.[pj][np][g]*"))
-    image_files = temp_files + label_files
+_IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+
+
+def _scan_image_entries():
+    """Scan temp/ and labels/ once, returning (mtime, size, path) newest first."""
+    entries = []
+    for directory in ("temp", "labels"):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if not name.endswith(_IMAGE_EXTS) or "write_something" in name:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError as e:
+                        logger.error(f"Error processing {entry.path}: {e}")
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    return entries
+
 
-    valid_images = [
-        f for f in image_files 
-        if "write_something" not in os.path.basename(f).lower()
-    ]
+def _file_fingerprint(image_path):
+    """Hash the first 4KB - enough to tell same-size files apart."""
+    with open(image_path, "rb") as f:
+        return hashlib.blake2b(f.read(4096), digest_size=8).digest()
+
+
+def list_saved_images(filter_duplicates=True):
+    entries = _scan_image_entries()
 
     if not filter_duplicates:
-        return sorted(valid_images, key=os.path.getmtime, reverse=True)[:HISTORY_LIMIT]
+        return [path for _, _, path in entries[:HISTORY_LIMIT]]
 
-    unique_images = {}
-    for image_path in valid_images:
-        try:
-            file_size = os.path.getsize(image_path)
-            
-            if file_size in unique_images:
-                existing_time = os.path.getmtime(unique_images[file_size])
-                current_time = os.path.getmtime(image_path)
-                if current_time > existing_time:
-                    unique_images[file_size] = image_path
-            else:
-                unique_images[file_size] = image_path
-        except Exception as e:
-            logger.error(f"Error processing {image_path}: {e}")
+    size_counts = {}
+    for _, size, _ in entries:
+        size_counts[size] = size_counts.get(size, 0) + 1
+
+    # Entries are newest first, so the first hit per key wins; files are only
+    # opened and fingerprinted when two of them collide on size
+    seen = set()
+    unique_images = []
+    for _, size, image_path in entries:
+        if size_counts[size] > 1:
+            try:
+                key = (size, _file_fingerprint(image_path))
+            except OSError as e:
+                logger.error(f"Error processing {image_path}: {e}")
+                continue
+        else:
+            key = size
+        if key in seen:
             continue
+        seen.add(key)
+        unique_images.append(image_path)
+        if len(unique_images) >= HISTORY_LIMIT:
+            break
+
+    return unique_images
+
+def _system_font_dirs():
+    """Return the platform's font directories."""
+    import platform
+    system = platform.system()
+
+    if system == "Windows":
+        return ["C:/Windows/Fonts/", "C:/Windows/System32/Fonts/"]
+    elif system == "Darwin":
+        return ["/System/Library/Fonts/", "/Library/Fonts/", f"/Users/{os.environ.get('USER', '')}/Library/Fonts/"]
+    elif system == "Linux":
+        return ["/usr/share/fonts/", "/usr/local/share/fonts/", f"/home/{os.environ.get('USER', '')}/.fonts/", f"/home/{os.environ.get('USER', '')}/.local/share/fonts/"]
+    return []
+
+
+# get_fonts walks thousands of system font files, so the result is cached and
+# only rebuilt when a font directory's mtime changes (e.g. a font got installed)
+_fonts_cache = None
+_fonts_cache_key = None
+
+
+def _font_dirs_cache_key(font_dirs):
+    key = []
+    for font_dir in ["fonts/"] + font_dirs:
+        try:
+            key.append((font_dir, os.path.getmtime(font_dir)))
+        except OSError:
+            key.append((font_dir, None))
+    return tuple(key)
 
-    return sorted(unique_images.values(), key=os.path.getmtime, reverse=True)[:HISTORY_LIMIT]
 
 def get_fonts():
     """Return list of fonts with 5x5-Tami.ttf as default, followed by system fonts (TTF and OTF)"""
+    global _fonts_cache, _fonts_cache_key
+
+    system_font_dirs = _system_font_dirs()
+    cache_key = _font_dirs_cache_key(system_font_dirs)
+    if _fonts_cache is not None and cache_key == _fonts_cache_key:
+        return _fonts_cache
+
     fonts = []
-    
+
     default_font = "fonts/5x5-Tami.ttf"
     if os.path.exists(default_font):
         fonts.append(default_font)
-    
+
     try:
         for font_file in os.listdir("fonts/"):
-            if (font_file.endswith(".ttf") or font_file.endswith(".otf")) and font_file != "5x5-Tami.ttf":
+            if font_file.endswith((".ttf", ".otf")) and font_file != "5x5-Tami.ttf":
                 fonts.append("fonts/" + font_file)
     except OSError:
         pass
-    
-    import platform
-    system = platform.system()
-    
-    system_font_dirs = []
-    if system == "Windows":
-        system_font_dirs = ["C:/Windows/Fonts/", "C:/Windows/System32/Fonts/"]
-    elif system == "Darwin":
-        system_font_dirs = ["/System/Library/Fonts/", "/Library/Fonts/", f"/Users/{os.environ.get('USER', '')}/Library/Fonts/"]
-    elif system == "Linux":
-        system_font_dirs = ["/usr/share/fonts/", "/usr/local/share/fonts/", f"/home/{os.environ.get('USER', '')}/.fonts/", f"/home/{os.environ.get('USER', '')}/.local/share/fonts/"]
-    
+
     for font_dir in system_font_dirs:
         if os.path.exists(font_dir):
             try:
                 for root, dirs, files in os.walk(font_dir):
                     for file in files:
-                        if file.lower().endswith('.ttf'):
-                            full_path = os.path.join(root, file)
-                            if full_path not in fonts:
-                                fonts.append(full_path)
+                        if file.endswith(('.ttf', '.TTF')):
+                            fonts.append(os.path.join(root, file))
             except (OSError, PermissionError):
                 continue
-    
+
     seen = set()
     unique_fonts = []
     for font in fonts:
         if font not in seen:
             seen.add(font)
             unique_fonts.append(font)
-    
-    return unique_fonts if unique_fonts else ["fonts/5x5-Tami.ttf"]
+
+    _fonts_cache = unique_fonts if unique_fonts else ["fonts/5x5-Tami.ttf"]
+    _fonts_cache_key = cache_key
+    return _fonts_cache
 
 label_dir = "labels"
 os.makedirs(label_dir, exist_ok=True)
 
+URL_PATTERN = re.compile(r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+")
+
+
 def find_url(string):
-    url_pattern = re.compile(r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+")
-    urls = re.findall(url_pattern, string)
-    return urls
+    # Cheap substring test first - the regex engine never runs on the vast
+    # majority of label texts, which contain no URL at all
+    if "http" not in string:
+        return []
+    return URL_PATTERN.findall(string)
 
 # ============================================================================
 # STREAMLIT APP
@@ -175,33 +252,45 @@ st.subheader(":primary[:heart: Kleben und kleben lassen :heart:]")
 # PRINTER DETECTION & CACHING
 # ============================================================================
 
-def get_cached_printers():
-    """Get printers, caching them in session state to avoid re-querying while busy."""
-    # Initialize session state for printers if not exists
-    if "cached_printers" not in st.session_state:
-        st.session_state.cached_printers = []
-        st.session_state.last_printer_check = 0
-
-    current_time = time.time()
-    # Re-check every 30 seconds, or if we have no printers
-    if current_time - st.session_state.last_printer_check > 30 or not st.session_state.cached_printers:
-        logger.info("Refreshing printer list...")
+@st.cache_resource
+def _printer_cache():
+    """Process-wide printer cache, shared by all sessions instead of per-session."""
+    return {"printers": [], "last_check": 0.0, "refreshing": False}
+
+
+def _refresh_printers(cache):
+    try:
         new_printers = find_and_parse_printer()
-        
+
         # If we found printers, update the cache
         # If we found NO printers but we HAD some, maybe they are just busy?
-        # We only overwrite if we actually found something, or if it's been a long time
-        if new_printers:
-            st.session_state.cached_printers = new_printers
-            st.session_state.last_printer_check = current_time
-        elif not st.session_state.cached_printers:
-            # Truly no printers found and none cached
-            st.session_state.cached_printers = []
-            st.session_state.last_printer_check = current_time
+        if new_printers or not cache["printers"]:
+            cache["printers"] = new_printers
         else:
             logger.warning("No printers found during refresh, keeping cached printers (they might be busy)")
-            
-    return st.session_state.cached_printers
+        cache["last_check"] = time.time()
+    finally:
+        cache["refreshing"] = False
+
+
+def get_cached_printers():
+    """Get printers from the shared cache, refreshing stale entries off the UI thread."""
+    cache = _printer_cache()
+    stale = time.time() - cache["last_check"] > 30
+
+    if not cache["printers"]:
+        # Nothing cached yet - this first scan has to block, the page needs a list
+        logger.info("Refreshing printer list...")
+        cache["refreshing"] = True
+        _refresh_printers(cache)
+    elif stale and not cache["refreshing"]:
+        # Serve the stale list immediately and re-scan USB in the background,
+        # so reruns never wait on printer discovery
+        logger.info("Printer list stale, refreshing in background...")
+        cache["refreshing"] = True
+        threading.Thread(target=_refresh_printers, args=(cache,), daemon=True).start()
+
+    return cache["printers"]
 
 st.sidebar.title(":primary[Settings]")
 
@@ -290,14 +379,14 @@ else:
         with tab_obj:
             try:
                 if tab_name == "Sticker":
-                    import tabs.sticker as sticker_module
+                    sticker_module = _get_tab_module("tabs.sticker")
                     sticker_module.render(
                         printer_info=selected_printer,
                         preper_image=preper_image,
                         print_image=print_image,
                     )
                 elif tab_name == "Label":
-                    import tabs.label as label_module
+                    label_module = _get_tab_module("tabs.label")
                     label_module.render(
                         printer_info=selected_printer,
                         get_fonts=get_fonts,
@@ -307,7 +396,7 @@ else:
                         img_concat_v=img_concat_v,
                     )
                 elif tab_name == "Text2image":
-                    import tabs.text2image as text2image_module
+                    text2image_module = _get_tab_module("tabs.text2image")
                     # For text2image, we need to define submit function
                     def submit():
                         st.session_state.prompt = st.session_state.widget
@@ -327,21 +416,21 @@ else:
                         printer_info=selected_printer,
                     )
                 elif tab_name == "Webcam":
-                    import tabs.webcam as webcam_module
+                    webcam_module = _get_tab_module("tabs.webcam")
                     webcam_module.render(
                         printer_info=selected_printer,
                         preper_image=preper_image,
                         print_image=print_image,
                     )
                 elif tab_name == "Cat":
-                    import tabs.cat as cat_module
+                    cat_module = _get_tab_module("tabs.cat")
                     cat_module.render(
                         printer_info=selected_printer,
                         preper_image=preper_image,
                         print_image=print_image,
                     )
                 elif tab_name == "Dog":
-                    import tabs.dog as dog_module
+                    dog_module = _get_tab_module("tabs.dog")
                     dog_module.render(
                         printer_info=selected_printer,
                         preper_image=preper_image,
@@ -349,7 +438,7 @@ else:
                     )
 
                 elif tab_name == "Sticker Pro":
-                    import tabs.sticker_pro as sticker_pro_module    
+                    sticker_pro_module = _get_tab_module("tabs.sticker_pro")    
                     sticker_pro_module.render(
                         print_image=print_image,
                         apply_threshold=apply_threshold,
@@ -360,17 +449,18 @@ else:
                         printer_info=selected_printer,
                     )
                 elif tab_name == "Tiling":
-                    import tabs.tiling as tiling_module
+                    tiling_module = _get_tab_module("tabs.tiling")
                     tiling_module.render(
                         preper_image=preper_image,
                         print_image=print_image,
+                        print_images=print_images,
                         printer_info=selected_printer,
                         determine_tile_rows=determine_tile_rows,
                         split_image_into_tiles=split_image_into_tiles,
                         create_tile_preview=create_tile_preview,
                     )
                 elif tab_name == "History":
-                    import tabs.history as history_module
+                    history_module = _get_tab_module("tabs.history")
                     history_module.render(
                         list_saved_images=list_saved_images,
                         print_image=print_image,
@@ -388,7 +478,7 @@ else:
                     #     st.error(f"Error loading Stats tab: {e}")
                     #     logger.error(f"Exception in Stats tab: {e}", exc_info=True)
                 elif tab_name == "FAQ":
-                    import tabs.faq as faq_module
+                    faq_module = _get_tab_module("tabs.faq")
                     faq_module.render()
                 else:
                     st.warning(f"Tab '{tab_name}' is not implemented yet")
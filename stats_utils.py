@@ -4,53 +4,106 @@ import json
 import os
 import logging
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger("sticker_factory.stats_utils")
 
-STATS_FILE = "print_stats.json"
+# orjson is optional - noticeably faster JSON parse/dump when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(line):
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _dumps_line(record):
+    if orjson is not None:
+        return orjson.dumps(record).decode() + '\n'
+    return json.dumps(record) + '\n'
+
+STATS_FILE = "print_stats.jsonl"
+LEGACY_STATS_FILE = "print_stats.json"
+
+# Keep only last 10000 records to prevent file from growing too large;
+# trimming happens via compaction once the file is well past that size
+MAX_RECORDS = 10000
+COMPACT_BYTES = 2 * 1024 * 1024
+
+
+def _migrate_legacy_stats():
+    """One-time migration from the old single-document JSON format."""
+    if os.path.exists(STATS_FILE) or not os.path.exists(LEGACY_STATS_FILE):
+        return
+    try:
+        with open(LEGACY_STATS_FILE, 'r') as f:
+            save_stats(json.load(f))
+        os.rename(LEGACY_STATS_FILE, LEGACY_STATS_FILE + ".bak")
+        logger.info(f"Migrated {LEGACY_STATS_FILE} to {STATS_FILE}")
+    except Exception as e:
+        logger.error(f"Error migrating legacy stats: {e}")
 
 
 def load_stats():
-    """Load statistics from JSON file."""
+    """Load statistics from the JSONL file."""
+    _migrate_legacy_stats()
     if not os.path.exists(STATS_FILE):
         return []
-    
+
     try:
         with open(STATS_FILE, 'r') as f:
-            return json.load(f)
+            return [_loads(line) for line in f if line.strip()]
     except Exception as e:
         logger.error(f"Error loading stats: {e}")
         return []
 
 
 def save_stats(stats):
-    """Save statistics to JSON file."""
+    """Rewrite the statistics file from scratch (used for compaction)."""
     try:
         with open(STATS_FILE, 'w') as f:
-            json.dump(stats, f, indent=2)
+            for record in stats:
+                f.write(_dumps_line(record))
     except Exception as e:
         logger.error(f"Error saving stats: {e}")
 
 
+def _compact_if_needed():
+    """Trim the stats file back to MAX_RECORDS once it grows past COMPACT_BYTES."""
+    try:
+        if os.path.getsize(STATS_FILE) < COMPACT_BYTES:
+            return
+        with open(STATS_FILE, 'r') as f:
+            last_lines = deque(f, maxlen=MAX_RECORDS)
+        with open(STATS_FILE, 'w') as f:
+            f.writelines(last_lines)
+        logger.info(f"Compacted stats file to last {MAX_RECORDS} records")
+    except Exception as e:
+        logger.error(f"Error compacting stats: {e}")
+
+
 def record_print(printer_name, printer_model=None):
     """Record a successful print job."""
-    stats = load_stats()
-    
-    # Add new print record
+    _migrate_legacy_stats()
+
     record = {
         "timestamp": datetime.now().isoformat(),
         "printer_name": printer_name,
         "printer_model": printer_model or "",
     }
-    
-    stats.append(record)
-    
-    # Keep only last 10000 records to prevent file from growing too large
-    if len(stats) > 10000:
-        stats = stats[-10000:]
-    
-    save_stats(stats)
+
+    try:
+        with open(STATS_FILE, 'a') as f:
+            f.write(_dumps_line(record))
+    except Exception as e:
+        logger.error(f"Error saving stats: {e}")
+        return
+
+    _compact_if_needed()
     logger.debug(f"Recorded print for printer: {printer_name}")
 
 
@@ -67,17 +120,16 @@ def get_stats_by_date(printer_name=None):
     for record in stats:
         if printer_name and record.get("printer_name") != printer_name:
             continue
-        
-        # Parse timestamp and get date
-        try:
-            timestamp = datetime.fromisoformat(record["timestamp"])
-            date_str = timestamp.strftime("%Y-%m-%d")
-            printer = record.get("printer_name", "Unknown")
-            date_stats[date_str][printer] += 1
-        except Exception as e:
-            logger.warning(f"Error parsing timestamp: {e}")
+
+        # ISO timestamps start with YYYY-MM-DD, so the date is a plain
+        # string slice - no datetime construction needed
+        timestamp = record.get("timestamp", "")
+        if len(timestamp) < 10:
+            logger.warning(f"Skipping record with bad timestamp: {timestamp!r}")
             continue
-    
+        printer = record.get("printer_name", "Unknown")
+        date_stats[timestamp[:10]][printer] += 1
+
     return dict(date_stats)
 
 
@@ -106,34 +158,24 @@ def get_stats_summary():
             "last_print": None,
         }
     
-    # Get first and last print timestamps
-    timestamps = [datetime.fromisoformat(r["timestamp"]) for r in stats if "timestamp" in r]
-    timestamps.sort()
-    
+    # ISO timestamps sort lexicographically, so min/max on the raw strings
+    # gives the first and last print without parsing
+    timestamps = [r["timestamp"] for r in stats if "timestamp" in r]
+
     return {
         "total_prints": len(stats),
         "printers": totals,
-        "first_print": timestamps[0].isoformat() if timestamps else None,
-        "last_print": timestamps[-1].isoformat() if timestamps else None,
+        "first_print": min(timestamps) if timestamps else None,
+        "last_print": max(timestamps) if timestamps else None,
     }
 
 
 def get_prints_today():
     """Get count of prints made today (resets at midnight)."""
     stats = load_stats()
-    today = datetime.now().date()
-    count = 0
-    
-    for record in stats:
-        try:
-            timestamp = datetime.fromisoformat(record["timestamp"])
-            if timestamp.date() == today:
-                count += 1
-        except Exception as e:
-            logger.warning(f"Error parsing timestamp: {e}")
-            continue
-    
-    return count
+    today_str = datetime.now().strftime("%Y-%m-%d")
+
+    return sum(1 for record in stats if record.get("timestamp", "").startswith(today_str))
 
 
 def get_prints_total():
@@ -1,10 +1,33 @@
 """History tab content - gallery of saved images."""
 
 import streamlit as st
+import hashlib
 import os
 from PIL import Image
 from datetime import datetime
 
+THUMB_CACHE_DIR = os.path.join(".cache", "thumbs")
+THUMB_SIZE = (400, 400)
+
+
+def _cached_thumb(image_path, size=THUMB_SIZE):
+    """Disk-cached gallery thumbnail, keyed on path, mtime and size."""
+    try:
+        mtime = os.path.getmtime(image_path)
+        key = hashlib.blake2b(f"{image_path}:{mtime}:{size}".encode(), digest_size=16).hexdigest()
+        cache_path = os.path.join(THUMB_CACHE_DIR, f"{key}.png")
+        if os.path.exists(cache_path):
+            return Image.open(cache_path)
+
+        os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+        thumb = Image.open(image_path)
+        thumb.thumbnail(size)
+        thumb.save(cache_path, "PNG")
+        return thumb
+    except Exception:
+        # Fall back to the full image if the cache trips up
+        return Image.open(image_path)
+
 
 def render(list_saved_images, print_image, preper_image):
     """Render the History tab."""
@@ -85,8 +108,7 @@ def render(list_saved_images, print_image, preper_image):
                     with cols[j]:
                         image_path = current_page_images[idx]
                         try:
-                            image = Image.open(image_path)
-                            st.image(image, width='stretch')
+                            st.image(_cached_thumb(image_path), width='stretch')
                             
                             filename = os.path.basename(image_path)
                             modified_time = datetime.fromtimestamp(
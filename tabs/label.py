@@ -1,60 +1,222 @@
 """Label tab content - extracted from main file for modularity."""
 
+import io
 import logging
+import os
+from functools import lru_cache
+
+import streamlit as st
+from PIL import Image, ImageDraw, ImageFont
 
 logger = logging.getLogger("sticker_factory.tabs.label")
 
+# Shared 1x1 scratch draw for text measurement
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("L", (1, 1), color=255))
+
+
+@lru_cache(maxsize=4096)
+def _measure(font, line):
+    """Cached textbbox at the origin for a (font, line) pair.
+
+    Fonts come out of _load_font, so equal (path, size) pairs share one
+    object and measurements survive across reruns.
+    """
+    return _MEASURE_DRAW.textbbox((0, 0), line, font=font)
+
 # This tab requires many helper functions from the main file
 # Import and use from printit.py context
 
+
+@st.cache_data(show_spinner=False)
+def _make_qr(url, border=0):
+    """Build the QR code image for a URL - deterministic, so cached across reruns."""
+    import qrcode
+    qr = qrcode.QRCode(border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    return qr.make_image(fill_color="black", back_color="white").get_image()
+
+
+@lru_cache(maxsize=256)
+def _load_font(font_path, size):
+    """Cached ImageFont.truetype handle - FreeType face parsing is not cheap.
+
+    Failed loads raise OSError and are not cached, so a font that appears
+    later is picked up on the next call.
+    """
+    return ImageFont.truetype(font_path, size)
+
+
+@lru_cache(maxsize=1)
+def _find_system_font():
+    """Probe for a usable fallback system font once per process."""
+    candidates = [
+        "C:/Windows/Fonts/arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/System/Library/Fonts/Helvetica.ttf",
+    ]
+    for sys_font in candidates:
+        if not os.path.exists(sys_font):
+            continue
+        try:
+            _load_font(sys_font, 12)
+            return sys_font
+        except OSError:
+            continue
+    return None
+
+
+# Reference size for the per-character advance table; advances scale
+# linearly with the point size, so one table serves every candidate size
+_REF_SIZE = 64
+
+
+@lru_cache(maxsize=64)
+def _advance_table(font_path):
+    """Advance widths for printable ASCII at the reference size."""
+    font = _load_font(font_path, _REF_SIZE)
+    return [font.getlength(chr(c)) for c in range(32, 127)]
+
+
+def _estimate_width(font_path, line, size):
+    """Estimate a line's width from summed ASCII advances, scaled from the
+    reference size. Non-ASCII characters fall back to the em width."""
+    table = _advance_table(font_path)
+    em = table[ord('M') - 32]
+    ref_width = sum(
+        table[ord(ch) - 32] if 32 <= ord(ch) < 127 else em for ch in line
+    )
+    return ref_width * size / _REF_SIZE
+
+
+@lru_cache(maxsize=256)
+def _font_display_name(font_path, mtime):
+    """Extract the actual font name from TTF file or use filename as fallback"""
+    try:
+        font = _load_font(font_path, 12)
+        # Try to get the font name from the font object
+        if hasattr(font, 'getname'):
+            name = font.getname()
+            if name:
+                # Join tuple elements with space (e.g., ('Guatemala', 'Italic') -> 'Guatemala Italic')
+                if isinstance(name, tuple):
+                    return ' '.join(name)
+                return name
+        # Fallback to filename without extension
+        return os.path.splitext(os.path.basename(font_path))[0]
+    except Exception:
+        # Fallback to filename without extension
+        return os.path.splitext(os.path.basename(font_path))[0]
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _render_label(text, font_path, font_size, label_width, alignment, line_spacing=20, padding=20):
+    """Rasterize the label text to PNG bytes.
+
+    The result is a pure function of its arguments, so it is cached:
+    widget interactions that don't change the text or font settings (QR
+    input typing, checkbox toggles) reuse the previous render instead of
+    re-measuring and re-drawing every line.
+    """
+    if font_path is None:
+        fnt = ImageFont.load_default()
+    else:
+        fnt = _load_font(font_path, font_size)
+
+    # Measure every line once, then size the canvas and draw from the
+    # in-memory layout - no separate height pass over the text
+    ascent, descent = fnt.getmetrics()
+    font_height = ascent + descent
+
+    layout = []
+    for line in text.split("\n"):
+        # blank lines take the font height without any measurement;
+        # the emptiness check avoids allocating a stripped copy
+        if line and not line.isspace():
+            bbox = _measure(fnt, line)
+            text_width = bbox[2] - bbox[0]
+            text_height = max(bbox[3] - bbox[1], font_height)
+        else:
+            text_width = 0
+            text_height = font_height
+        layout.append((line, text_width, text_height))
+
+    new_image_height = sum(h + line_spacing for _, _, h in layout) + padding * 2
+    # The label is black-on-white for a monochrome printer; an "L" canvas
+    # holds one byte per pixel instead of three
+    img = Image.new("L", (label_width, new_image_height), color=255)
+    d = ImageDraw.Draw(img)
+    y = padding
+
+    # Pick the x-offset rule once instead of branching on the alignment
+    # inside the draw loop; widths are already in the layout list
+    if alignment == "center":
+        x_for = lambda w: (label_width - w) // 2
+    elif alignment == "right":
+        x_for = lambda w: label_width - w
+    else:
+        x_for = lambda w: 0
+
+    for line, text_width, text_height in layout:
+        d.text((x_for(text_width), y), line, font=fnt, fill=0)
+        y += text_height + line_spacing
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def get_font_display_name(font_path):
+    """Cached display name for a font file; mtime in the key catches replaced files."""
+    try:
+        mtime = os.path.getmtime(font_path)
+    except OSError:
+        mtime = None
+    return _font_display_name(font_path, mtime)
+
 def render(printer_info, get_fonts, find_url, preper_image, print_image, img_concat_v):
     """Render the Label tab - implementation from main printit.py."""
-    import streamlit as st
-    import os
-    import qrcode
-    from PIL import Image, ImageDraw, ImageFont
-    
     st.subheader(":printer: a label")
 
     label_type = printer_info["label_type"]
     label_width = printer_info["label_width"]
     # Helper functions
-    def calculate_actual_image_height_with_empty_lines(text, font, line_spacing=10):
-        draw = ImageDraw.Draw(Image.new("RGB", (1, 1), color="white"))
-        total_height = 0
-        ascent, descent = font.getmetrics()
-        font_height = ascent + descent
-
-        for line in text.split("\n"):
-            if line.strip():
-                bbox = draw.textbbox((0, 0), line, font=font)
-                text_height = max(bbox[3] - bbox[1], font_height)
-            else:
-                text_height = font_height
-            total_height += text_height + line_spacing
+    def calculate_max_font_size(width, text, font_path, start_size=10, end_size=200):
+        try:
+            non_empty_lines = [line for line in text.split("\n") if line.strip()]
+            if not non_empty_lines:
+                return start_size
 
-        padding = 20
-        return total_height + (padding * 2)
+            def fits_estimate(size):
+                max_text_width = max(_estimate_width(font_path, line, size) for line in non_empty_lines)
+                return max_text_width <= width
 
-    def calculate_max_font_size(width, text, font_path, start_size=10, end_size=200, step=1):
-        try:
-            draw = ImageDraw.Draw(Image.new("RGB", (1, 1), color="white"))
-            max_font_size = start_size
+            def fits_exact(size):
+                font = _load_font(font_path, size)
+                max_text_width = max(_measure(font, line)[2] for line in non_empty_lines)
+                return max_text_width <= width
 
-            for size in range(start_size, end_size, step):
-                try:
-                    font = ImageFont.truetype(font_path, size)
-                except OSError:
-                    return 50
-                adjusted_lines = [line for line in text.split("\n")]
-                max_text_width = max([draw.textbbox((0, 0), line, font=font)[2] for line in adjusted_lines if line.strip()])
-
-                if max_text_width <= width:
-                    max_font_size = size
+            # "fits" is monotonic in the size, so binary search for the
+            # largest fitting size. The search runs on the cheap advance-sum
+            # estimate (no font loads or textbbox calls per probe) ...
+            lo, hi = start_size, end_size - 1
+            max_font_size = start_size
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                if fits_estimate(mid):
+                    max_font_size = mid
+                    lo = mid + 1
                 else:
-                    break
+                    hi = mid - 1
+
+            # ... and one exact measurement corrects for kerning, stepping
+            # down in the rare case the estimate was a touch too optimistic
+            while max_font_size > start_size and not fits_exact(max_font_size):
+                max_font_size -= 1
 
             return max_font_size
+        except OSError:
+            return 50
         except Exception as e:
             logger.error(f"Error in calculate_max_font_size: {e}")
             return 50
@@ -62,6 +224,11 @@ def render(printer_info, get_fonts, find_url, preper_image, print_image, img_con
     text = st.text_area("Enter your text to print", "write something", height=200)
     
     if text:
+        # Split once and reuse - both sizing branches below need the
+        # longest line, no point walking the text repeatedly per rerun
+        lines = text.splitlines() or ['']
+        max_chars_per_line = max(map(len, lines)) or 1
+
         urls = find_url(text)
         if urls:
             st.success("Found URLs: we might automate the QR code TODO")
@@ -80,23 +247,10 @@ def render(printer_info, get_fonts, find_url, preper_image, print_image, img_con
         font = st.session_state.selected_font
 
         try:
-            test_font = ImageFont.truetype(font, 12)
+            test_font = _load_font(font, 12)
         except OSError:
-            working_font = None
-            system_fonts = [
-                "C:/Windows/Fonts/arial.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                "/System/Library/Fonts/Helvetica.ttf",
-            ]
-            
-            for sys_font in system_fonts:
-                try:
-                    ImageFont.truetype(sys_font, 12)
-                    working_font = sys_font
-                    break
-                except OSError:
-                    continue
-            
+            working_font = _find_system_font()
+
             if working_font:
                 font = working_font
                 st.warning(f"Custom fonts not available, using system font: {working_font}")
@@ -110,10 +264,8 @@ def render(printer_info, get_fonts, find_url, preper_image, print_image, img_con
                     st.stop()
 
         try:
-            chars_per_line = max(len(line) for line in text.split('\n'))
-            if chars_per_line == 0:
-                chars_per_line = 1
-            
+            chars_per_line = max_chars_per_line
+
             if label_type == "62":
                 base_font_size = 60
                 base_width = 696
@@ -142,24 +294,6 @@ def render(printer_info, get_fonts, find_url, preper_image, print_image, img_con
         if fontstuff:
             with col1:
                 # Create a mapping of font names (from metadata) to paths
-                def get_font_display_name(font_path):
-                    """Extract the actual font name from TTF file or use filename as fallback"""
-                    try:
-                        font = ImageFont.truetype(font_path, 12)
-                        # Try to get the font name from the font object
-                        if hasattr(font, 'getname'):
-                            name = font.getname()
-                            if name:
-                                # Join tuple elements with space (e.g., ('Guatemala', 'Italic') -> 'Guatemala Italic')
-                                if isinstance(name, tuple):
-                                    return ' '.join(name)
-                                return name
-                        # Fallback to filename without extension
-                        return os.path.splitext(os.path.basename(font_path))[0]
-                    except Exception:
-                        # Fallback to filename without extension
-                        return os.path.splitext(os.path.basename(font_path))[0]
-                
                 font_display_names = [get_font_display_name(f) for f in fonts]
                 font_name_to_path = {name: path for name, path in zip(font_display_names, fonts)}
                 
@@ -182,9 +316,7 @@ def render(printer_info, get_fonts, find_url, preper_image, print_image, img_con
             
             try:
                 if font == "fonts/5x5-Tami.ttf":
-                    chars_per_line = max(len(line) for line in text.split('\n'))
-                    if chars_per_line == 0:
-                        chars_per_line = 1
+                    chars_per_line = max_chars_per_line
                     if label_type == "62":
                         font_size = 60
                     elif label_type == "102":
@@ -200,59 +332,24 @@ def render(printer_info, get_fonts, find_url, preper_image, print_image, img_con
                 logger.error(f"Error calculating font size for {font}: {e}")
             font_size = st.slider("Font Size", 20, max_size + 50, max_size, help="Supports both TTF and OTF fonts")
 
-        try:
-            if font is None:
-                fnt = ImageFont.load_default()
-            else:
-                try:
-                    fnt = ImageFont.truetype(font, font_size)
-                except (OSError, TypeError):
-                    # Fallback if font loading fails (TTF or OTF)
-                    fnt = ImageFont.load_default()
-                    st.warning(f"Font {font} not found, using default font.")
-        except Exception as e:
-            try:
-                fnt = ImageFont.load_default()
-                st.warning(f"Error loading font {font}: {e}")
-            except Exception as load_e:
-                st.error(f"Error loading font: {load_e}")
-        
         line_spacing = 20
-        new_image_height = calculate_actual_image_height_with_empty_lines(text, fnt, line_spacing)
         padding = 20
-        img = Image.new("RGB", (label_width, new_image_height), color="white")
-        d = ImageDraw.Draw(img)
-        y = padding
 
-        for line in text.split("\n"):
-            text_width = 0
-            ascent, descent = fnt.getmetrics()
-            font_height = ascent + descent
-
-            if line.strip():
-                bbox = d.textbbox((0, y), line, font=fnt)
-                text_width = bbox[2] - bbox[0]
-                text_height = max(bbox[3] - bbox[1], font_height)
-            else:
-                text_height = font_height
-
-            if alignment == "center":
-                x = (label_width - text_width) // 2
-            elif alignment == "right":
-                x = label_width - text_width
-            else:
-                x = 0
+        # The expensive measure/draw path lives in _render_label and is
+        # cached on its inputs - unrelated widget interactions reuse it
+        try:
+            png_bytes = _render_label(text, font, font_size, label_width, alignment, line_spacing, padding)
+        except (OSError, TypeError):
+            # Fallback if font loading fails (TTF or OTF)
+            st.warning(f"Font {font} not found, using default font.")
+            png_bytes = _render_label(text, None, font_size, label_width, alignment, line_spacing, padding)
 
-            d.text((x, y), line, font=fnt, fill=(0, 0, 0))
-            y += text_height + line_spacing
+        img = Image.open(io.BytesIO(png_bytes))
 
-        qr = qrcode.QRCode(border=0)
         qrurl = st.text_input("add a QRcode to your sticker")
-        
+
         if qrurl:
-            qr.add_data(qrurl)
-            qr.make(fit=True)
-            imgqr = qr.make_image(fill_color="black", back_color="white")
+            imgqr = _make_qr(qrurl)
 
             if imgqr and img:
                 logger.debug("Both sticker and QR code present, concatenating images.")
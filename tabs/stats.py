@@ -6,6 +6,13 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger("sticker_factory.tabs.stats")
 
+# pandas is optional - bulk chart-frame construction when available, the
+# dict-based fallback keeps working on ARM/Raspberry Pi without it
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 # Lazy import stats_utils to avoid import-time issues
 def _get_stats_functions():
     """Lazy import stats functions."""
@@ -17,21 +24,30 @@ def _get_stats_functions():
         raise
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_stats():
+    """Read the stats store once for all three views.
+
+    The store only changes on print events, so a 30s TTL keeps interactions
+    (selectbox, expander) from re-reading the file while new prints still
+    show up promptly.
+    """
+    get_stats_by_date, get_total_stats, get_stats_summary = _get_stats_functions()
+    return get_stats_by_date(), get_total_stats(), get_stats_summary()
+
+
 def render():
     """Render the Statistics tab."""
     st.subheader(":chart_with_upwards_trend: Print Statistics")
-    
-    # Lazy import stats functions
+
+    # Lazy import + single cached read of the stats store
     try:
-        get_stats_by_date, get_total_stats, get_stats_summary = _get_stats_functions()
+        date_stats, totals, summary = _cached_stats()
     except Exception as e:
         st.error(f"Statistics module is not available: {e}")
         st.info("Statistics tracking may be disabled or unavailable.")
         return
     
-    # Get summary stats
-    summary = get_stats_summary()
-    
     # Display summary cards
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -52,9 +68,6 @@ def render():
         else:
             st.metric("Last Print", "Never")
     
-    # Get stats by date
-    date_stats = get_stats_by_date()
-    
     if not date_stats:
         st.info("No print statistics available yet. Start printing to see statistics!")
         return
@@ -74,34 +87,49 @@ def render():
     else:
         cutoff_date = None
     
-    # Filter date_stats by cutoff_date
-    filtered_date_stats = {}
-    for date_str, printers in date_stats.items():
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-        if cutoff_date is None or date_obj >= cutoff_date.date():
-            filtered_date_stats[date_str] = printers
+    # Filter date_stats by cutoff_date before any chart work - ISO date keys
+    # compare lexicographically, so no per-date strptime is needed
+    if cutoff_date is None:
+        filtered_date_stats = date_stats
+    else:
+        cutoff_str = cutoff_date.strftime("%Y-%m-%d")
+        filtered_date_stats = {
+            date_str: printers
+            for date_str, printers in date_stats.items()
+            if date_str >= cutoff_str
+        }
     
     if not filtered_date_stats:
         st.info(f"No prints in the selected time range ({selected_range}).")
         return
     
-    # Prepare data for line chart (no pandas needed!)
-    # Streamlit charts work with dicts: {date: {printer: count}}
-    chart_data = {}
-    all_printers = set()
-    
-    # Collect all printer names
-    for printers in filtered_date_stats.values():
-        all_printers.update(printers.keys())
-    
-    # Build chart data structure: {date: {printer1: count1, printer2: count2}}
     sorted_dates = sorted(filtered_date_stats.keys())
-    for date_str in sorted_dates:
-        chart_data[date_str] = {}
-        for printer in all_printers:
-            chart_data[date_str][printer] = filtered_date_stats[date_str].get(printer, 0)
-    
-    # Line chart - Streamlit can handle dict of dicts
+
+    if pd is not None:
+        # Flat records into one pivot_table - the datetime conversion and
+        # the grouping both run as single vectorized operations
+        records = [
+            (date_str, printer, count)
+            for date_str, printers in filtered_date_stats.items()
+            for printer, count in printers.items()
+        ]
+        chart_data = pd.DataFrame.from_records(records, columns=["date", "printer", "count"])
+        chart_data["date"] = pd.to_datetime(chart_data["date"], format="%Y-%m-%d")
+        chart_data = chart_data.pivot_table(
+            index="date", columns="printer", values="count", aggfunc="sum", fill_value=0
+        )
+    else:
+        # No pandas: Streamlit charts work with dicts: {date: {printer: count}}
+        chart_data = {}
+        all_printers = set()
+        for printers in filtered_date_stats.values():
+            all_printers.update(printers.keys())
+        for date_str in sorted_dates:
+            chart_data[date_str] = {}
+            for printer in all_printers:
+                chart_data[date_str][printer] = filtered_date_stats[date_str].get(printer, 0)
+
+    # Line chart - Streamlit can handle a DataFrame or a dict of dicts
     st.subheader("Prints Over Time")
     try:
         st.line_chart(chart_data, use_container_width=True)
@@ -115,8 +143,6 @@ def render():
     
     # Printer totals
     st.subheader("Total Prints by Printer")
-    totals = get_total_stats()
-    
     if totals:
         # Create bar chart data - Streamlit accepts dict directly
         totals_sorted = dict(sorted(totals.items(), key=lambda x: x[1], reverse=True))
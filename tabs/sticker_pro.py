@@ -218,11 +218,19 @@ def render(print_image,printer_info, apply_threshold, add_border, apply_histogra
             
             # Process image based on choice
             dither = False
+            dither_scale = 1
             grayscale_image = None
             dithered_image = None
             if print_choice == "Original":
                 dither = st.checkbox("Dither - approximate grey tones with dithering", value=True, key="sticker_pro_dither")
-                grayscale_image, dithered_image = preper_image(image, label_width=printer_info['label_width'])
+                fast_preview = st.checkbox(
+                    "Fast preview - dither at half resolution",
+                    value=False,
+                    key="sticker_pro_fast_preview",
+                    help="Speeds up preview updates for large images; prints always use full resolution"
+                )
+                dither_scale = 2 if fast_preview else 1
+                grayscale_image, dithered_image = preper_image(image, label_width=printer_info['label_width'], dither_scale=dither_scale)
                 display_image = dithered_image if dither else grayscale_image
             else:  # Threshold
                 threshold_percent = st.slider("Threshold (%)", 0, 100, 50, key="sticker_pro_threshold")
@@ -266,7 +274,13 @@ def render(print_image,printer_info, apply_threshold, add_border, apply_histogra
         
         if st.button(print_button_label, key="sticker_pro_print"):
             rotate = 90 if (rotate_checkbox and not rotate_disabled) else 0
-            
+
+            # Fast preview dithers at reduced resolution; redo the prepare
+            # at full resolution so the printed sticker keeps full detail
+            if print_choice == "Original" and dither and dither_scale != 1:
+                grayscale_image, dithered_image = preper_image(image, label_width=printer_info['label_width'])
+                display_image = dithered_image
+
             # Apply meme text to the image being printed if enabled
             print_display_image = display_image.copy()
             if meme_checkbox and (meme_top_text or meme_bottom_text):
@@ -1,5 +1,6 @@
 """Tiling tab content - split images into multiple label rows."""
 
+import hashlib
 import logging
 import streamlit as st
 import os
@@ -9,31 +10,61 @@ from PIL import Image
 logger = logging.getLogger("sticker_factory.tabs.tiling")
 
 
+@st.cache_data(show_spinner="Fetching image...", ttl=3600, max_entries=32)
+def _fetch_image_bytes(url):
+    """Cached HTTPS GET for an image URL.
+
+    Raises on bad responses so failures aren't cached and get retried.
+    """
+    import requests
+    response = requests.get(url, timeout=10)
+    response.raise_for_status()
+
+    # Verify content type is an image
+    content_type = response.headers.get('content-type', '')
+    if not content_type.startswith('image/'):
+        raise ValueError('URL does not point to a valid image')
+
+    return response.content
+
+
+@st.cache_data(show_spinner="Rendering PDF...", max_entries=8)
+def _rasterize_pdf_page(pdf_bytes, dpi):
+    """Rasterize the first PDF page - deterministic in (bytes, dpi), so cached.
+
+    Returns (mode, size, pixels) for Image.frombytes: the raw pixmap
+    buffer goes straight to PIL with no encode/decode roundtrip. The
+    document is closed before returning so the parsed PDF and its page
+    tree don't outlive the single page we need.
+    """
+    import fitz  # PyMuPDF
+    pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        page = pdf_document.load_page(0)
+        pix = page.get_pixmap(dpi=dpi)
+        mode = "RGBA" if pix.alpha else "RGB"
+        return mode, (pix.width, pix.height), bytes(pix.samples)
+    finally:
+        pdf_document.close()
+
+
 def fetch_image_from_url(url):
     """Validate and fetch image from URL."""
     if not url.startswith('https://'):
         st.error('Only HTTPS URLs are allowed for security')
         return None
-        
+
     try:
-        import requests
-        from io import BytesIO
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        # Verify content type is an image
-        content_type = response.headers.get('content-type', '')
-        if not content_type.startswith('image/'):
-            st.error('URL does not point to a valid image')
-            return None
-            
-        return Image.open(BytesIO(response.content)).convert("RGB")
+        return Image.open(io.BytesIO(_fetch_image_bytes(url))).convert("RGB")
+    except ValueError as e:
+        st.error(str(e))
+        return None
     except Exception as e:
         st.error(f'Error fetching image: {str(e)}')
         return None
 
 
-def render(preper_image, print_image, printer_info, determine_tile_rows, split_image_into_tiles, create_tile_preview):
+def render(preper_image, print_image, print_images, printer_info, determine_tile_rows, split_image_into_tiles, create_tile_preview):
     """Render the Tiling tab."""
     st.subheader(":printer: tiling mode")
     st.markdown("Upload an image to split it into 2 rows of labels")
@@ -57,19 +88,13 @@ def render(preper_image, print_image, printer_info, determine_tile_rows, split_i
         # Handle PDF files
         if uploaded_image.type == "application/pdf":
             try:
-                import fitz  # PyMuPDF
-                
                 st.info("PDF file detected. Converting the first page to an image.")
                 dpi_selected = st.selectbox("Select the DPI for the conversion", [72, 92, 150, 300, 600], index=1, key="tiling_pdf_dpi")
-                
-                # Open the PDF file
-                pdf_document = fitz.open(stream=uploaded_image.read(), filetype="pdf")
-                
-                # Convert the first page to an image
-                page = pdf_document.load_page(0)
-                pix = page.get_pixmap(dpi=dpi_selected)
-                image_to_process = Image.open(io.BytesIO(pix.tobytes("png"))).convert("RGB")
-                
+
+                # Rasterize the first page (cached per upload + DPI)
+                mode, size, pixels = _rasterize_pdf_page(uploaded_image.getvalue(), dpi_selected)
+                image_to_process = Image.frombytes(mode, size, pixels).convert("RGB")
+
             except ImportError:
                 st.error("PyMuPDF (fitz) is not installed. Install it with: pip install pymupdf")
                 st.stop()
@@ -77,8 +102,14 @@ def render(preper_image, print_image, printer_info, determine_tile_rows, split_i
                 st.error(f"Error converting PDF: {str(e)}")
                 st.stop()
         else:
-            # Convert the uploaded file to a PIL Image
-            image_to_process = Image.open(uploaded_image).convert("RGB")
+            # Convert the uploaded file to a PIL Image. For JPEGs, ask the
+            # decoder for a pre-scaled DCT decode: the tile pipeline caps the
+            # size right below, so decoding at native resolution is wasted
+            img = Image.open(uploaded_image)
+            if img.format == "JPEG":
+                draft_bound = label_width * 4  # conservative upper bound
+                img.draft("RGB", (draft_bound, draft_bound))
+            image_to_process = img.convert("RGB")
     
     elif image_url:
         # Try to fetch and process image from URL
@@ -89,12 +120,30 @@ def render(preper_image, print_image, printer_info, determine_tile_rows, split_i
         num_rows = determine_tile_rows(image_to_process, label_width)
         
         st.info(f"Image will be split into **{num_rows} rows** of labels")
-        
-        # Split image into tiles
-        tiles = split_image_into_tiles(image_to_process, label_width, num_rows)
-        
-        # Create and show preview
-        preview_image = create_tile_preview(tiles, label_width)
+
+        # The tile pipeline only ever needs label_width pixels per row, so
+        # huge uploads (24MP camera JPEGs) get downscaled before anything
+        # else touches them - everything downstream shrinks proportionally
+        max_width = label_width * num_rows
+        if image_to_process.width > max_width:
+            new_height = int(image_to_process.height * max_width / image_to_process.width)
+            image_to_process.thumbnail((max_width, new_height), Image.LANCZOS)
+            logger.debug(f"Pre-downscaled upload to {image_to_process.size} for tiling")
+
+
+        # Splitting and previewing the full-resolution image is expensive, so
+        # the results are kept in session state keyed on the image content and
+        # label width - checkbox toggles and print clicks reuse them
+        img_hash = hashlib.blake2b(image_to_process.tobytes(), digest_size=16).hexdigest()
+        cache_key = (img_hash, label_width, num_rows)
+        if st.session_state.get("tiling_cache_key") != cache_key:
+            tiles = split_image_into_tiles(image_to_process, label_width, num_rows)
+            st.session_state.tiling_cache_key = cache_key
+            st.session_state.tiling_tiles = tiles
+            st.session_state.tiling_preview = create_tile_preview(tiles, label_width)
+
+        tiles = st.session_state.tiling_tiles
+        preview_image = st.session_state.tiling_preview
         st.image(preview_image, caption=f"Preview: {num_rows} tiles arranged vertically", use_container_width=True)
         
         # Show individual tiles in columns
@@ -120,25 +169,18 @@ def render(preper_image, print_image, printer_info, determine_tile_rows, split_i
         if st.button(button_text, key="tiling_print_all", type="primary"):
             rotate_value = 90  # Always rotate 90 degrees
             dither_value = dither_checkbox
-            
+
             st.info(f"Printing {len(tiles)} tiles...")
-            success_count = 0
-            
-            for i, tile in enumerate(tiles):
-                with st.spinner(f"Printing tile {i+1}/{len(tiles)}..."):
-                    # Prepare the tile for printing
-                    prepared_tile = tile.copy()
-                    success = print_image(
-                        prepared_tile, 
-                        printer_info=printer_info, 
-                        rotate=rotate_value, 
-                        dither=dither_value
-                    )
-                    if success:
-                        success_count += 1
-                    else:
-                        st.warning(f"Failed to print tile {i+1}")
-            
+
+            # Enqueue all tiles at once so encoding the later ones overlaps
+            # with printing the earlier ones
+            success_count = print_images(
+                tiles,
+                printer_info=printer_info,
+                rotate=rotate_value,
+                dither=dither_value
+            )
+
             if success_count == len(tiles):
                 st.success(f"Successfully printed all {len(tiles)} tiles!")
             else: